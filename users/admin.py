@@ -1,3 +1,69 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.utils.translation import ngettext
 
-# Register your models here.
+from .models import User, Profile
+from .pagination import EstimatedCountPaginator, KeysetChangeList
+
+
+class ScalableChangeListMixin:
+    # users_user is far too big for COUNT(*) and OFFSET on every changelist hit.
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    ordering = ('-pk',)
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+
+@admin.register(User)
+class UserAdmin(ScalableChangeListMixin, BaseUserAdmin):
+    list_display = ('email', 'username', 'role', 'is_active', 'is_staff', 'date_joined')
+    list_filter = ('role', 'is_active', 'is_staff')
+    # Only offer sorting on columns backed by a unique index.
+    sortable_by = ('email', 'username')
+    # email/username are covered by trigram indexes, phone by a prefix index.
+    search_fields = ('email', 'username', '^phone')
+    readonly_fields = ('date_joined', 'last_login')
+    actions = ('activate_users', 'deactivate_users')
+
+    fieldsets = (
+        (None, {'fields': ('email', 'username', 'password')}),
+        ('Personal info', {'fields': ('first_name', 'last_name', 'phone', 'mobile_number', 'role')}),
+        ('Permissions', {'fields': ('is_active', 'is_staff', 'is_superuser', 'groups', 'user_permissions')}),
+        ('Important dates', {'fields': ('last_login', 'date_joined')}),
+    )
+    add_fieldsets = (
+        (None, {
+            'classes': ('wide',),
+            'fields': ('email', 'username', 'role', 'password1', 'password2'),
+        }),
+    )
+
+    def _set_active(self, request, queryset, is_active):
+        # One UPDATE for the whole selection, even with "select all" across pages.
+        updated = queryset.update(is_active=is_active)
+        state = 'activated' if is_active else 'deactivated'
+        self.message_user(request, ngettext(
+            '%(count)d user was %(state)s.',
+            '%(count)d users were %(state)s.',
+            updated,
+        ) % {'count': updated, 'state': state})
+
+    @admin.action(description='Activate selected users', permissions=['change'])
+    def activate_users(self, request, queryset):
+        self._set_active(request, queryset, True)
+
+    @admin.action(description='Deactivate selected users', permissions=['change'])
+    def deactivate_users(self, request, queryset):
+        self._set_active(request, queryset, False)
+
+
+@admin.register(Profile)
+class ProfileAdmin(ScalableChangeListMixin, admin.ModelAdmin):
+    list_display = ('user', 'address', 'updated_at')
+    list_select_related = ('user',)
+    sortable_by = ()
+    search_fields = ('user__email', 'user__username')
+    # A <select> of every user would render millions of options.
+    raw_id_fields = ('user',)
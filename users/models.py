@@ -1,5 +1,7 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 
 class User(AbstractUser):
   ROLE_CHOICES = (
@@ -16,6 +18,14 @@ class User(AbstractUser):
   USERNAME_FIELD = 'email'
   REQUIRED_FIELDS = ['role']
 
+  class Meta(AbstractUser.Meta):
+      # Admin search runs icontains/istartswith, which compare UPPER(column).
+      indexes = [
+          GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='users_user_email_trgm'),
+          GinIndex(OpClass(Upper('username'), name='gin_trgm_ops'), name='users_user_username_trgm'),
+          models.Index(OpClass(Upper('phone'), name='text_pattern_ops'), name='users_user_phone_prefix'),
+      ]
+
   def __str__(self):
       return f"{self.username} ({self.role})"
 
@@ -0,0 +1,152 @@
+import json
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList, ORDER_VAR, PAGE_VAR
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections, transaction
+from django.utils.functional import cached_property
+
+# Query string parameter carrying the last primary key of the previous page.
+KEYSET_VAR = 'after'
+
+
+class EstimatedCountPaginator(Paginator):
+    # Below this many rows an exact COUNT(*) is cheap enough to run.
+    exact_count_threshold = 10000
+
+    is_estimated = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+
+        if not queryset.query.where:
+            estimate = self._table_estimate(connection, queryset.model._meta.db_table)
+            # reltuples is -1 (or 0) until the table has been analyzed.
+            if estimate > self.exact_count_threshold:
+                self.is_estimated = True
+                return estimate
+            return super().count
+
+        # Filtered lists only count up to the threshold, past that the
+        # planner's row estimate is good enough for the page links.
+        bounded = queryset.order_by()[:self.exact_count_threshold + 1].count()
+        if bounded <= self.exact_count_threshold:
+            return bounded
+        self.is_estimated = True
+        try:
+            # Savepoint so a failed EXPLAIN can't break the surrounding transaction.
+            with transaction.atomic(using=queryset.db):
+                estimate = self._plan_estimate(connection, queryset)
+        except (DatabaseError, LookupError, TypeError, ValueError):
+            estimate = bounded
+        return max(estimate, bounded)
+
+    def get_elided_page_range(self, number=1, *, on_each_side=3, on_ends=2):
+        pages = super().get_elided_page_range(number, on_each_side=on_each_side, on_ends=on_ends)
+        if not self.is_estimated:
+            yield from pages
+            return
+        # num_pages comes from an estimate, so the trailing page numbers are
+        # guesses and the deepest OFFSETs there are. Stop after the window
+        # around the current page and leave the rest to keyset "Next" links.
+        number = self.validate_number(number)
+        previous = None
+        for page in pages:
+            if page != self.ELLIPSIS and page > number + on_each_side:
+                if previous != self.ELLIPSIS:
+                    yield self.ELLIPSIS
+                return
+            yield page
+            previous = page
+
+    def _table_estimate(self, connection, db_table):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)',
+                [connection.ops.quote_name(db_table)],
+            )
+            row = cursor.fetchone()
+        return row[0] if row and row[0] is not None else -1
+
+    def _plan_estimate(self, connection, queryset):
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+            plan = cursor.fetchone()[0]
+        # The driver normally decodes the json column, but don't rely on it.
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        if isinstance(plan, list):
+            plan = plan[0]
+        return int(plan['Plan']['Plan Rows'])
+
+
+class KeysetChangeList(ChangeList):
+    """
+    Serve "next page" links as ``?after=<pk>`` so deep pages seek on the
+    primary key index instead of scanning past an ever growing OFFSET.
+    Numbered page links are still OFFSET backed, and with an estimated count
+    only the ones near the current page are offered.
+    """
+
+    keyset_after = None
+    keyset_next_url = None
+    # True only when the current page was served by seeking on the cursor.
+    keyset_active = False
+    keyset_first_url = None
+
+    def __init__(self, request, *args, **kwargs):
+        # request.GET is left alone so preserved filters keep the cursor and
+        # "back to list" from a change form returns to the same page.
+        if KEYSET_VAR in request.GET:
+            try:
+                self.keyset_after = int(request.GET.getlist(KEYSET_VAR)[-1])
+            except ValueError:
+                raise IncorrectLookupParameters
+        super().__init__(request, *args, **kwargs)
+        # Filter and sort links start over from the top of the new list.
+        self.params.pop(KEYSET_VAR, None)
+
+    def get_filters_params(self, params=None):
+        # ChangeList treats unknown parameters as field lookups.
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(KEYSET_VAR, None)
+        return lookup_params
+
+    @property
+    def keyset_enabled(self):
+        # Seeking only lines up with the list when it's in default -pk order.
+        return ORDER_VAR not in self.params
+
+    def get_results(self, request):
+        if self.keyset_after is None or not self.keyset_enabled:
+            super().get_results(request)
+            if self.keyset_enabled and self.multi_page and not (self.show_all and self.can_show_all):
+                rows = list(self.result_list)
+                # A full page isn't proof of a next one, so check for a row past it.
+                if len(rows) == self.list_per_page and self.queryset.filter(pk__lt=rows[-1].pk).exists():
+                    self.keyset_next_url = self.get_keyset_url(rows[-1].pk)
+            return
+
+        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        rows = list(self.queryset.filter(pk__lt=self.keyset_after)[:self.list_per_page + 1])
+
+        self.result_count = paginator.count
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = rows[:self.list_per_page]
+        self.can_show_all = False
+        self.multi_page = True
+        self.paginator = paginator
+        self.keyset_active = True
+        self.keyset_first_url = self.get_query_string(remove=[KEYSET_VAR, PAGE_VAR])
+        if len(rows) > self.list_per_page:
+            self.keyset_next_url = self.get_keyset_url(rows[self.list_per_page - 1].pk)
+
+    def get_keyset_url(self, pk):
+        return self.get_query_string({KEYSET_VAR: pk}, remove=[PAGE_VAR])
@@ -1,3 +1,131 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.admin.sites import site
+from django.db import DatabaseError, connection
+from django.test import TestCase, RequestFactory, override_settings
+from django.urls import reverse
+
+from .admin import UserAdmin
+from .models import User
+from .pagination import EstimatedCountPaginator
+
+
+def make_users(count, role='BOOKER'):
+    return User.objects.bulk_create([
+        User(email=f'{role.lower()}{i}@example.com', username=f'{role.lower()}{i}', role=role)
+        for i in range(count)
+    ])
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        make_users(3, role='BOOKER')
+        make_users(2, role='COMPANION')
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE users_user')
+
+    def test_exact_count_below_threshold(self):
+        paginator = EstimatedCountPaginator(User.objects.order_by('-pk'), 2)
+        self.assertEqual(paginator.count, 5)
+        self.assertFalse(paginator.is_estimated)
+
+    def test_estimated_count_above_threshold(self):
+        self.analyze()
+        paginator = EstimatedCountPaginator(User.objects.order_by('-pk'), 2)
+        paginator.exact_count_threshold = 2
+        self.assertEqual(paginator.count, 5)
+        self.assertTrue(paginator.is_estimated)
+
+    def test_filtered_count_uses_plan_estimate(self):
+        self.analyze()
+        queryset = User.objects.filter(role='BOOKER').order_by('-pk')
+        paginator = EstimatedCountPaginator(queryset, 2)
+        paginator.exact_count_threshold = 2
+        self.assertGreater(paginator._plan_estimate(connection, queryset), 0)
+        self.assertGreaterEqual(paginator.count, 3)
+        self.assertTrue(paginator.is_estimated)
+
+    def test_filtered_count_falls_back_when_explain_fails(self):
+        paginator = EstimatedCountPaginator(User.objects.filter(role='BOOKER').order_by('-pk'), 2)
+        paginator.exact_count_threshold = 2
+        with mock.patch.object(EstimatedCountPaginator, '_plan_estimate', side_effect=DatabaseError):
+            self.assertEqual(paginator.count, 3)
+        self.assertTrue(paginator.is_estimated)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+@mock.patch.object(UserAdmin, 'list_per_page', 2)
+class KeysetChangeListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            email='admin@example.com', username='admin', password='password', role='BOOKER',
+        )
+        make_users(4)
+        cls.pks = list(User.objects.order_by('-pk').values_list('pk', flat=True))
+        cls.url = reverse('admin:users_user_changelist')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_after_returns_next_rows(self):
+        response = self.client.get(self.url, {'after': self.pks[1]})
+        cl = response.context['cl']
+        self.assertTrue(cl.keyset_active)
+        self.assertEqual([user.pk for user in cl.result_list], self.pks[2:4])
+        self.assertEqual(cl.keyset_next_url, f'?after={self.pks[3]}')
+
+    def test_last_page_has_no_next_url(self):
+        response = self.client.get(self.url, {'after': self.pks[2]})
+        cl = response.context['cl']
+        self.assertEqual([user.pk for user in cl.result_list], self.pks[3:5])
+        self.assertIsNone(cl.keyset_next_url)
+
+    def test_first_page_links_to_cursor(self):
+        response = self.client.get(self.url)
+        cl = response.context['cl']
+        self.assertFalse(cl.keyset_active)
+        self.assertEqual(cl.keyset_next_url, f'?after={self.pks[1]}')
+
+    def test_invalid_cursor_redirects(self):
+        response = self.client.get(self.url, {'after': 'abc'})
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.endswith('?e=1'))
+
+    def test_ordering_falls_back_to_offset(self):
+        response = self.client.get(self.url, {'o': '1', 'after': self.pks[1]})
+        cl = response.context['cl']
+        self.assertFalse(cl.keyset_active)
+        self.assertIsNone(cl.keyset_next_url)
+        self.assertEqual(
+            [user.pk for user in cl.result_list],
+            list(User.objects.order_by('email').values_list('pk', flat=True)[:2]),
+        )
+
+    def test_cursor_is_preserved_for_change_form(self):
+        response = self.client.get(self.url, {'after': self.pks[1]})
+        self.assertIn(f'after%3D{self.pks[1]}', response.context['cl'].preserved_filters)
+
+
+class UserAdminActionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        make_users(3)
+
+    def setUp(self):
+        self.model_admin = UserAdmin(User, site)
+        self.request = RequestFactory().post('/')
+
+    def test_deactivate_users_is_one_update(self):
+        with mock.patch.object(self.model_admin, 'message_user'), self.assertNumQueries(1):
+            self.model_admin.deactivate_users(self.request, User.objects.all())
+        self.assertFalse(User.objects.filter(is_active=True).exists())
+
+    def test_activate_users_is_one_update(self):
+        User.objects.update(is_active=False)
+        with mock.patch.object(self.model_admin, 'message_user'), self.assertNumQueries(1):
+            self.model_admin.activate_users(self.request, User.objects.all())
+        self.assertFalse(User.objects.filter(is_active=False).exists())